@@ -1,37 +1,18 @@
 import pybullet as p
-import pybullet_data
 import time
 import numpy as np
-from gripper.pawl_2f import pawl_2f
-from gripper.pawl_3f import pawl_3f
-from object.cube import cube
-from object.cylinder import cylinder
+from Env.World import World
 import pandas as pd
 from ML.Classifier import ClassifierGraspPlanner
 
 
 class SimEnv:
-    def __init__(self,robot,object):
-        self.cid = p.connect(p.GUI)
-        p.setAdditionalSearchPath(pybullet_data.getDataPath())
-        p.resetSimulation()
-        p.setGravity(0, 0, -10)
-        p.setRealTimeSimulation(0)
-        p.resetDebugVisualizerCamera(
-            cameraDistance=1,
-            cameraYaw=40,
-            cameraPitch=-30,
-            cameraTargetPosition=[0, 0, 0.2]
-        )
-        p.loadURDF("plane.urdf")
-        if robot=="2f":
-            self.pawl = pawl_2f()
-        else:
-            self.pawl = pawl_3f(object)
-        if object == "cube":
-            self.obj = cube()
-        else:
-            self.obj = cylinder()
+    def __init__(self,robot,object,world=None):
+        # A shared World keeps its assets loaded across configurations
+        self.owns_world = world is None
+        self.world = World() if world is None else world
+        self.cid = self.world.cid
+        self.pawl, self.obj = self.world.activate(robot, object)
         
         
     def catch(self):
@@ -59,26 +40,67 @@ class SimEnv:
 
         # Close gripper to grasp
         self.pawl.close_gripper()
+        contact_steps = 0
         for _ in range(50):
             p.stepSimulation()
+            contact_steps += self._in_contact()
             time.sleep(1./240.)
 
         # Lift cube
+        lift_start = self._object_in_gripper_frame()
         self.pawl.move_gripper([0,0,0.3],p.getQuaternionFromEuler(randposition[1]),force=500)
         for _ in range(50):
             p.stepSimulation()
+            contact_steps += self._in_contact()
             time.sleep(1./240.)
 
         # Move along x to drop location
         for _ in range(50):
             p.stepSimulation()
+            contact_steps += self._in_contact()
             time.sleep(1./240.)
             
+        lift_end = self._object_in_gripper_frame()
         pos, orn = p.getBasePositionAndOrientation(self.obj.cube_id)
-        if pos[2]>0.1:
-            return randposition,1
-        else:
-            return randposition,0
+        label = 1 if pos[2]>0.1 else 0
+        quality = self.grasp_quality(label, lift_start, lift_end, contact_steps/150)
+        return randposition,label,quality
+
+    def _in_contact(self):
+        return int(self.pawl.count_contacts(self.obj.cube_id).sum() > 0)
+
+    def _object_in_gripper_frame(self):
+        """Object pose in world and in the gripper base frame, plus gripper height"""
+        grip_pos, grip_orn = p.getBasePositionAndOrientation(self.pawl.obj)
+        obj_pos, obj_orn = p.getBasePositionAndOrientation(self.obj.cube_id)
+        inv_pos, inv_orn = p.invertTransform(grip_pos, grip_orn)
+        rel_pos, _ = p.multiplyTransforms(inv_pos, inv_orn, obj_pos, obj_orn)
+        return {"grip_z": grip_pos[2], "obj_pos": obj_pos, "obj_orn": obj_orn, "rel_pos": rel_pos}
+
+    @staticmethod
+    def grasp_quality(label, lift_start, lift_end, contact_ratio):
+        """
+        Continuous grasp quality in [0, 1].
+
+        Averages four scores in [0, 1] -- how far the object followed the
+        gripper up, slip of the object relative to the gripper, object tilt
+        during the lift and the fraction of steps with finger contact -- and
+        maps it to [0, 0.5] for failed grasps and [0.5, 1] for successful
+        ones, so quality >= 0.5 exactly when the grasp succeeded.
+        """
+        grip_rise = lift_end["grip_z"] - lift_start["grip_z"]
+        obj_rise = lift_end["obj_pos"][2] - lift_start["obj_pos"][2]
+        height_score = np.clip(obj_rise / grip_rise, 0, 1) if grip_rise > 1e-6 else 0.0
+
+        slip = np.linalg.norm(np.subtract(lift_end["rel_pos"], lift_start["rel_pos"]))
+        slip_score = np.exp(-slip / 0.02)
+
+        dot = abs(np.dot(lift_start["obj_orn"], lift_end["obj_orn"]))
+        tilt = 2 * np.arccos(np.clip(dot, 0, 1))
+        tilt_score = 1 - min(tilt / (np.pi / 2), 1)
+
+        score = np.mean([height_score, slip_score, tilt_score, contact_ratio])
+        return float(0.5 * label + 0.5 * score)
 
         
     def reset(self):
@@ -93,16 +115,17 @@ class SimEnv:
                 "roll": [],
                 "pitch": [],
                 "yaw": [],
-                "label": []
+                "label": [],
+                "quality": []
                 }
         for i in range(num):
             print(f"Generating data {i}")
             self.reset()
             data = self.catch()
             if data[1]==1:
-                print("This grasp is Success")
+                print(f"This grasp is Success (quality {data[2]:.3f})")
             else:
-                print("This grasp is Fail")
+                print(f"This grasp is Fail (quality {data[2]:.3f})")
             #s = f"{data[0][0][0]} {data[0][0][1]}  {data[0][0][2]}  {data[0][1][0]}  {data[0][1][1]}  {data[0][1][2]}  {data[1]}"
             df["x"].append(data[0][0][0])
             df["y"].append(data[0][0][1])
@@ -111,6 +134,7 @@ class SimEnv:
             df["pitch"].append(data[0][1][1])
             df["yaw"].append(data[0][1][2])
             df["label"].append(data[1])
+            df["quality"].append(data[2])
             
         df = pd.DataFrame(df)
         df.to_csv(csv_path,index=False)
@@ -139,7 +163,25 @@ class SimEnv:
             
             
         
+    def benchmark(self,num):
+        """Time grasp trials and report the Python-to-C calls saved by the batched gripper APIs"""
+        print(f"Calls saved at gripper setup: {self.pawl.calls_saved}")
+        trial_times = []
+        trial_saved = []
+        for i in range(num):
+            self.pawl.calls_saved = 0
+            start = time.perf_counter()
+            self.reset()
+            self.catch()
+            trial_times.append(time.perf_counter() - start)
+            trial_saved.append(self.pawl.calls_saved)
+            print(f"Trial {i}: {trial_times[-1]:.3f}s, calls saved: {trial_saved[-1]}")
+        print(f"Mean trial time: {np.mean(trial_times):.3f}s")
+        print(f"Mean calls saved per trial: {np.mean(trial_saved):.1f}")
+        self.finish()
+        
     def finish(self):
-        p.disconnect()
+        if self.owns_world:
+            self.world.close()
         
 
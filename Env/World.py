@@ -0,0 +1,90 @@
+import pybullet as p
+import pybullet_data
+import time
+from gripper.pawl_2f import pawl_2f
+from gripper.pawl_3f import pawl_3f
+from object.cube import cube
+from object.cylinder import cylinder
+
+
+class World:
+    """
+    Session-level pybullet world shared by several SimEnv configurations.
+
+    Connects and loads plane.urdf once, then loads each gripper and object
+    lazily the first time it is requested. Switching configuration parks the
+    inactive bodies away from the workspace instead of reconnecting, so the
+    URDF/mesh parsing (and the 2f mimic constraints) is only paid once.
+    """
+
+    # Parking slots on the plane, far from the grasping workspace at the origin
+    GRIPPER_PARK = {"2f": [5, -1, 0.5], "3f": [5, 1, 0.5]}
+    OBJECT_PARK = {"cube": [-5, -1], "cylinder": [-5, 1]}
+
+    def __init__(self, gui=True):
+        self.gui = gui
+        self.cid = p.connect(p.GUI if gui else p.DIRECT)
+        p.setAdditionalSearchPath(pybullet_data.getDataPath())
+        # Reuse parsed mesh files across loadURDF calls
+        p.setPhysicsEngineParameter(enableFileCaching=1)
+        p.resetSimulation()
+        p.setGravity(0, 0, -10)
+        p.setRealTimeSimulation(0)
+        if gui:
+            p.resetDebugVisualizerCamera(
+                cameraDistance=1,
+                cameraYaw=40,
+                cameraPitch=-30,
+                cameraTargetPosition=[0, 0, 0.2]
+            )
+        p.loadURDF("plane.urdf")
+
+        self.grippers = {}
+        self.objects = {}
+        self.active_robot = None
+        self.active_object = None
+        # (robot, object) -> list of setup times in seconds
+        self.setup_times = {}
+
+    def activate(self, robot, object):
+        """Make (robot, object) the active configuration and return (pawl, obj)"""
+        start = time.perf_counter()
+
+        if self.active_robot is not None and self.active_robot != robot:
+            self._park_gripper(self.active_robot)
+        if self.active_object is not None and self.active_object != object:
+            self._park_object(self.active_object)
+
+        if robot not in self.grippers:
+            self.grippers[robot] = pawl_2f() if robot == "2f" else pawl_3f(object)
+        if object not in self.objects:
+            self.objects[object] = cube() if object == "cube" else cylinder()
+
+        pawl = self.grippers[robot]
+        obj = self.objects[object]
+        if robot == "3f":
+            # The 3f finger targets depend on the object type
+            pawl.object = object
+        pawl.reset()
+        obj.reset()
+        self.active_robot = robot
+        self.active_object = object
+
+        elapsed = time.perf_counter() - start
+        self.setup_times.setdefault((robot, object), []).append(elapsed)
+        print(f"Setup {robot}/{object}: {elapsed:.3f}s")
+        return pawl, obj
+
+    def _park_gripper(self, robot):
+        pawl = self.grippers[robot]
+        park_pos = self.GRIPPER_PARK[robot]
+        p.resetBasePositionAndOrientation(pawl.obj, park_pos, pawl.base_quat)
+        pawl.move_gripper(park_pos, pawl.base_quat)
+
+    def _park_object(self, object):
+        obj = self.objects[object]
+        park_pos = self.OBJECT_PARK[object] + [obj.height/2]
+        p.resetBasePositionAndOrientation(obj.cube_id, park_pos, [0, 0, 0, 1])
+
+    def close(self):
+        p.disconnect(self.cid)
@@ -1,8 +1,8 @@
 import joblib
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, is_regressor
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from typing import Tuple, Optional, List
 import numpy as np
 import pandas as pd
@@ -15,15 +15,24 @@ class ClassifierGraspPlanner():
     Uses an internal Pipeline:
         [ StandardScaler -> RandomForestClassifier ]
     Can replace it with SVC / MLPClassifier / XGBoost etc.
+
+    With regression=True the pipeline ends in a RandomForestRegressor trained
+    on the continuous grasp quality instead (quality >= 0.5 means success).
+    The mode is inferred from the estimator when a model is loaded.
     """
 
+    # Quality at or above this value corresponds to a successful grasp
+    SUCCESS_THRESHOLD = 0.5
+
     def __init__(
         self,
         classifier: Optional[BaseEstimator] = None,
+        regression: bool = False,
     ) -> None:
-        # Default to a simple RandomForestClassifier
+        # Default to a simple RandomForestClassifier / RandomForestRegressor
         if classifier is None:
-            classifier = RandomForestClassifier(
+            forest = RandomForestRegressor if regression else RandomForestClassifier
+            classifier = forest(
                 n_estimators=200,
                 max_depth=None,
                 random_state=42,
@@ -41,21 +50,38 @@ class ClassifierGraspPlanner():
 
     # ------------ Implement abstract methods ------------
 
+    @property
+    def is_regression(self) -> bool:
+        return is_regressor(self.pipeline.named_steps["clf"])
+
     def train(self, X: np.ndarray, y: np.ndarray) -> None:
-        """Train the classification model"""
+        """Train the model (y is the 0/1 label, or the quality in regression mode)"""
         self.pipeline.fit(X, y)
         self._is_trained = True
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """Predict binary classification results (0/1)"""
         self._check_trained()
+        if self.is_regression:
+            return (self.predict_quality(X) >= self.SUCCESS_THRESHOLD).astype(int)
         return self.pipeline.predict(X)
 
+    def predict_quality(self, X: np.ndarray) -> np.ndarray:
+        """Predict the continuous grasp quality (regression mode only)"""
+        self._check_trained()
+        if not self.is_regression:
+            raise RuntimeError("predict_quality requires a regression planner.")
+        return np.clip(self.pipeline.predict(X), 0.0, 1.0)
+
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         """Predict the probability for each class (column 1 is success probability)"""
         self._check_trained()
-        
-        if hasattr(self.pipeline.named_steps["clf"], "predict_proba"):
+
+        if self.is_regression:
+            # Predicted quality used as a success score
+            quality = self.predict_quality(X)
+            return np.vstack([1.0 - quality, quality]).T
+        elif hasattr(self.pipeline.named_steps["clf"], "predict_proba"):
             return self.pipeline.predict_proba(X)
         else:
             # Use decision_function to estimate probabilities
@@ -67,6 +93,12 @@ class ClassifierGraspPlanner():
             prob_fail = 1.0 - prob_success
             return np.vstack([prob_fail, prob_success]).T
 
+    def rank(self, X: np.ndarray) -> np.ndarray:
+        """Indices of candidate grasps sorted from most to least robust"""
+        # Success probability, or predicted quality in regression mode
+        score = self.predict_proba(X)[:, 1]
+        return np.argsort(-score, kind="stable")
+
     def save(self, path: str) -> None:
         """Save the pipeline to disk"""
         joblib.dump(self.pipeline, path)
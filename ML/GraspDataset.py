@@ -12,8 +12,12 @@ class GraspDataset:
     Encapsulates the grasp dataset:
         - pandas DataFrame
         - feature_columns: List of input feature column names (pose parameters)
-        - label_column: Label column name (0: fail, 1: success)
+        - label_column: Label column name (0: fail, 1: success), or the
+          continuous "quality" column when training a regression planner
     """
+    # Target columns written by the generator, never used as features
+    TARGET_COLUMNS = ["label", "quality"]
+
     df: pd.DataFrame
     feature_columns: List[str]
     label_column: str
@@ -29,13 +33,16 @@ class GraspDataset:
         df = pd.read_csv(path)
 
         if feature_columns is None:
-            # Assume the last column is the label, and all previous columns are features
+            # Assume all non-target columns are features
             all_cols = list(df.columns)
             if label_column not in all_cols:
                 raise ValueError(
                     f"Label column '{label_column}' not found in CSV columns: {all_cols}"
                 )
-            feature_columns = [c for c in all_cols if c != label_column]
+            feature_columns = [
+                c for c in all_cols
+                if c != label_column and c not in cls.TARGET_COLUMNS
+            ]
 
         return cls(df=df, feature_columns=feature_columns, label_column=label_column)
 
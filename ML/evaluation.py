@@ -0,0 +1,143 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, brier_score_loss, roc_auc_score
+from ML.GraspDataset import GraspDataset
+from ML.Classifier import ClassifierGraspPlanner
+
+
+def expected_calibration_error(
+    y_true: np.ndarray,
+    prob_success: np.ndarray,
+    n_bins: int = 10,
+) -> float:
+    """
+    Expected calibration error: the sample-weighted mean gap between predicted
+    success probability and observed success rate over equal-width bins.
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    prob_success = np.asarray(prob_success, dtype=float)
+    bins = np.clip((prob_success * n_bins).astype(int), 0, n_bins - 1)
+
+    ece = 0.0
+    for b in range(n_bins):
+        mask = bins == b
+        if not mask.any():
+            continue
+        gap = abs(prob_success[mask].mean() - y_true[mask].mean())
+        ece += mask.mean() * gap
+    return float(ece)
+
+
+def _score(y_true: np.ndarray, prob_success: np.ndarray, n_bins: int) -> Dict[str, float]:
+    """Compute all report metrics for one (model, dataset) pair"""
+    y_pred = (prob_success >= 0.5).astype(int)
+    # AUC is undefined when the holdout set only contains one class
+    if len(np.unique(y_true)) < 2:
+        auc = float("nan")
+    else:
+        auc = float(roc_auc_score(y_true, prob_success))
+    return {
+        "accuracy": float(accuracy_score(y_true, y_pred)),
+        "auc": auc,
+        "brier": float(brier_score_loss(y_true, prob_success)),
+        "ece": expected_calibration_error(y_true, prob_success, n_bins=n_bins),
+    }
+
+
+def _evaluate_model(
+    model_path: str,
+    datasets: List[Tuple[str, np.ndarray, np.ndarray]],
+    n_bins: int,
+) -> List[Dict]:
+    """
+    Worker: load one model and score it against every dataset.
+
+    Runs in a separate process, so each model is unpickled exactly once.
+    """
+    planner = ClassifierGraspPlanner()
+    planner.load(model_path)
+    # The pool already provides the parallelism, avoid oversubscribing cores
+    clf = planner.pipeline.named_steps["clf"]
+    if hasattr(clf, "n_jobs"):
+        clf.n_jobs = 1
+
+    rows = []
+    for dataset_path, X, y in datasets:
+        prob_success = planner.predict_proba(X)[:, 1]
+        row = {"model": model_path, "dataset": dataset_path, "n_samples": len(y)}
+        row.update(_score(y, prob_success, n_bins))
+        rows.append(row)
+    return rows
+
+
+def evaluate_planners(
+    model_paths: List[str],
+    dataset_paths: List[str],
+    output_path: Optional[str] = None,
+    label_column: str = "label",
+    feature_columns: Optional[List[str]] = None,
+    n_bins: int = 10,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Evaluate every model against every labeled dataset offline (no simulation).
+
+    Parameters:
+        model_paths: Paths to joblib models saved by ClassifierGraspPlanner
+        dataset_paths: Paths to labeled CSV datasets
+        output_path: Where to write the report (.json or .csv), None to skip
+        label_column: Name of the label column (0/1)
+        feature_columns: List of feature column names (if None, all non-label columns)
+        n_bins: Number of bins used for the calibration error
+        max_workers: Size of the process pool (None = number of CPUs)
+
+    Returns:
+        A DataFrame with one row per (model, dataset) pair and the columns
+        accuracy, auc, brier and ece
+    """
+
+    if output_path is not None:
+        ext = os.path.splitext(output_path)[1].lower()
+        if ext not in (".json", ".csv"):
+            raise ValueError(f"Unsupported report format '{ext}', use .json or .csv")
+
+    # 1. Load every dataset once, workers receive plain arrays
+    datasets = []
+    for path in dataset_paths:
+        ds = GraspDataset.from_csv(
+            path,
+            label_column=label_column,
+            feature_columns=feature_columns,
+        )
+        X = ds.df[ds.feature_columns].values
+        y = ds.df[ds.label_column].values.astype(int)
+        datasets.append((path, X, y))
+
+    # 2. One task per model, each scores all datasets
+    rows = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_evaluate_model, model_path, datasets, n_bins)
+            for model_path in model_paths
+        ]
+        for future in futures:
+            rows.extend(future.result())
+
+    report = pd.DataFrame(rows)
+    print(report.to_string(index=False))
+
+    # 3. Save the report
+    if output_path is not None:
+        if ext == ".json":
+            with open(output_path, "w") as f:
+                # NaN is not valid JSON, store undefined metrics as null
+                json.dump(report.astype(object).where(report.notna(), None).to_dict(orient="records"), f, indent=2)
+        else:
+            report.to_csv(output_path, index=False)
+        print(f"Evaluation report saved to: {output_path}")
+
+    return report
@@ -1,5 +1,5 @@
 from typing import Tuple, Optional, List
-from sklearn.metrics import accuracy_score, classification_report
+from sklearn.metrics import accuracy_score, classification_report, mean_absolute_error, r2_score
 from ML.GraspDataset import GraspDataset
 from ML.Classifier import ClassifierGraspPlanner
 
@@ -10,22 +10,26 @@ def train_classifier_based_planner(
     label_column: str = "label",
     feature_columns: Optional[List[str]] = None,
     test_size: float = 0.2,
+    regression: bool = False,
 ) -> ClassifierGraspPlanner:
     """
     Train a classifier-based grasp planner and print validation set performance.
 
     Parameters:
         dataset_path: Path to the CSV or pickle file
-        label_column: Name of the label column (0/1)
+        label_column: Name of the label column (0/1), ignored when regression is True
         feature_columns: List of feature column names (if None, defaults to "last column is label, others are features")
         test_size: Proportion of the validation set
         model_output_path: Path to save the model
+        regression: Train a regressor on the continuous "quality" column instead of the 0/1 label
 
     Returns:
         A trained ClassifierGraspPlanner instance
     """
 
     # 1. Load the dataset
+    if regression:
+        label_column = "quality"
 
     ds = GraspDataset.from_csv(
             dataset_path,
@@ -38,15 +42,21 @@ def train_classifier_based_planner(
     print("Dataset size:", len(ds.df))
 
     # 2. Split the training/validation set
-    X_train, X_val, y_train, y_val = ds.train_test_split(test_size=test_size)
+    X_train, X_val, y_train, y_val = ds.train_test_split(test_size=test_size, stratify=not regression)
 
     # 3. Initialize the planner (internally creates the classifier)
-    planner = ClassifierGraspPlanner()
+    planner = ClassifierGraspPlanner(regression=regression)
 
     # 4. Train
     planner.train(X_train, y_train)
 
     # 5. Evaluate on the validation set
+    if regression:
+        quality_pred = planner.predict_quality(X_val)
+        print(f"Validation quality MAE: {mean_absolute_error(y_val, quality_pred):.4f}")
+        print(f"Validation quality R2: {r2_score(y_val, quality_pred):.4f}")
+        # Quality above the threshold is exactly a successful grasp
+        y_val = (y_val >= planner.SUCCESS_THRESHOLD).astype(int)
     y_pred = planner.predict(X_val)
     acc = accuracy_score(y_val, y_pred)
     print(f"Validation accuracy: {acc * 100:.2f}%")
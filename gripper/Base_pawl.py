@@ -1,12 +1,17 @@
 from algorithm.random_gripper import generate_random_gripper_pose
 import pybullet as p
+import numpy as np
 
 
 class pawls:
     def __init__(self,urdf_name,pos,quat):
         self.base_pos = pos
         self.base_quat = quat
-        self.obj = p.loadURDF(urdf_name, pos, quat, useFixedBase=False)
+        self.obj = p.loadURDF(urdf_name, pos, quat, useFixedBase=False,
+                              flags=p.URDF_ENABLE_CACHED_GRAPHICS_SHAPES)
+        self.num_joints = p.getNumJoints(self.obj)
+        # Python-to-C calls avoided by the batched APIs below (vs. one call per joint)
+        self.calls_saved = 0
     def init_state(self):
         pass
     def reset(self):
@@ -25,8 +30,41 @@ class pawls:
                 maxForce=force
             )
         
+    def get_joint_states(self,joints=None):
+        """Read positions and velocities of several joints with one getJointStates call"""
+        if joints is None:
+            joints = range(self.num_joints)
+        joints = list(joints)
+        states = p.getJointStates(self.obj, joints)
+        self.calls_saved += len(joints) - 1
+        positions = np.array([s[0] for s in states])
+        velocities = np.array([s[1] for s in states])
+        return positions, velocities
+    
+    def set_joint_targets(self,joints,targets,forces):
+        """Position-control several joints with one setJointMotorControlArray call"""
+        joints = list(joints)
+        p.setJointMotorControlArray(self.obj, joints, p.POSITION_CONTROL,
+                                    targetPositions=np.broadcast_to(targets, len(joints)).tolist(),
+                                    forces=np.broadcast_to(forces, len(joints)).tolist())
+        self.calls_saved += len(joints) - 1
+        
+    def release_joints(self,joints):
+        """Disable the default velocity motors of several joints with one call"""
+        joints = list(joints)
+        p.setJointMotorControlArray(self.obj, joints, p.VELOCITY_CONTROL,
+                                    targetVelocities=[0] * len(joints),
+                                    forces=[0] * len(joints))
+        self.calls_saved += len(joints) - 1
+        
+    def count_contacts(self,body):
+        """Number of contact points between each gripper link and `body` (index = link id)"""
+        contacts = p.getContactPoints(bodyA=self.obj, bodyB=body)
+        links = np.array([c[3] for c in contacts if c[3] >= 0], dtype=int)
+        return np.bincount(links, minlength=self.num_joints)
+        
     def get_randpos(self,height):
         rand_pose = generate_random_gripper_pose(cube_center=[0,0,height/2],)
         pos = [rand_pose[0],rand_pose[1],rand_pose[2]]
         orn = [rand_pose[3],rand_pose[4],rand_pose[5]]
-        return pos,orn
\ No newline at end of file
+        return pos,orn
@@ -27,10 +27,9 @@ class pawl_2f(pawls):
         
         
     def init_state(self):
-        num_joints = p.getNumJoints(self.obj)
         JointInfo = namedtuple('JointInfo',['id','name','type','lower','upper','maxForce'])
         self.joints = []
-        for i in range(num_joints):
+        for i in range(self.num_joints):
             info = p.getJointInfo(self.obj, i)
             jid = info[0]
             name = info[1].decode()
@@ -39,7 +38,7 @@ class pawl_2f(pawls):
             upper = info[9]
             maxForce = info[10]
             self.joints.append(JointInfo(jid,name,jtype,lower,upper,maxForce))
-            p.setJointMotorControl2(self.obj,jid,p.VELOCITY_CONTROL,targetVelocity=0,force=0)
+        self.release_joints([j.id for j in self.joints])
         mimic_parent_name = 'finger_joint'
         mimic_children_names = {'right_outer_knuckle_joint':1,
                                 'left_inner_knuckle_joint':1,
@@ -11,7 +11,6 @@ class pawl_3f(pawls):
         pos = [0, 0, 0.5]
         quat = p.getQuaternionFromEuler([3.14, 0, 0])
         super().__init__("./urdf/3f/sdh/sdh.urdf", pos, quat)
-        self.num_joints = p.getNumJoints(self.obj)
         self.ratio = 0.45
         self.object = object
 
@@ -28,27 +27,27 @@ class pawl_3f(pawls):
         )
 
 
-    def open_gripper(self):
-        """Gradually open fingers until fully open."""
+        self.init_state()
+
+    def init_state(self):
+        # setJointMotorControlArray has no maxVelocity argument, but the motor
+        # keeps the velocity clamp once set, so apply it a single time here
+        positions = self.get_joint_positions()
         for k in range(self.num_joints):
-            if k in [2, 5, 8]:
-                self._apply_joint_command(k, 0.7)
-            elif k in [3, 6, 0] :
-                self._apply_joint_command(k, 0.9 if self.object == "cube" else 0)
-            elif k in [1, 4, 7] :
-                self._apply_joint_command(k, -0.6)
+            p.setJointMotorControl2(self.obj, k, p.POSITION_CONTROL,
+                                    targetPosition=positions[k], maxVelocity=10, force=60)
 
-    def _apply_joint_command(self, joint, target):
-        p.setJointMotorControl2(self.obj, joint, p.POSITION_CONTROL,
-                                targetPosition=target, maxVelocity=10, force=60)
+    def open_gripper(self):
+        """Gradually open fingers until fully open."""
+        joints = self.PRESHAPE_JOINTS + [3, 6, 0] + self.GRASP_JOINTS
+        targets = [0.7] * 3 + [0.9 if self.object == "cube" else 0] * 3 + [-0.6] * 3
+        self.set_joint_targets(joints, targets, forces=60)
 
     def get_joint_positions(self):
-        return [p.getJointState(self.obj, i)[0] for i in range(self.num_joints)]
+        return self.get_joint_states()[0]
 
     def close_gripper(self):
-        for j in [1, 4,7]:
-            p.setJointMotorControl2(self.obj, j, p.POSITION_CONTROL,
-                                        targetPosition=-0.2 if self.object == "cube" else 0, maxVelocity=10, force=60)
-        for k in [2, 5, 8]:
-            p.setJointMotorControl2(self.obj, k, p.POSITION_CONTROL,
-                                    targetPosition=1, maxVelocity=10, force=100)
+        joints = self.GRASP_JOINTS + self.PRESHAPE_JOINTS
+        targets = [-0.2 if self.object == "cube" else 0] * 3 + [1] * 3
+        forces = [60] * 3 + [100] * 3
+        self.set_joint_targets(joints, targets, forces)
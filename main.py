@@ -1,11 +1,12 @@
 import argparse
 from Env.SimEnv import SimEnv
 from ML.training import train_classifier_based_planner
+from ML.evaluation import evaluate_planners
 
 
 def main():
     parser = argparse.ArgumentParser(description="Pybullet Grasping")
-    subparsers = parser.add_subparsers(dest="mode", required=True, help="Mode (generator, training, testing)")
+    subparsers = parser.add_subparsers(dest="mode", required=True, help="Mode (generator, training, testing, evaluate, benchmark)")
     
     # Generator
     Generator_parser = subparsers.add_parser("generator", help="Generate dataset")
@@ -19,6 +20,7 @@ def main():
     Training_parser.add_argument("--dataset", type=str, required=True, help="Path to dataset.")
     Training_parser.add_argument("--model", type=str, required=True, help="Path to save model.")
     Training_parser.add_argument("--test_size", type=float, required=False, help="Label column.")
+    Training_parser.add_argument("--regression", action="store_true", help="Train on the continuous grasp quality.")
     
     # Testing
     Testing_parser = subparsers.add_parser("testing", help="Test classifier")
@@ -27,6 +29,19 @@ def main():
     Testing_parser.add_argument("--model", type=str, required=True, help="Path to model.")
     Testing_parser.add_argument("--num", type=int, required=True, help="Number of samples.")
     
+    # Evaluate
+    Evaluate_parser = subparsers.add_parser("evaluate", help="Evaluate classifiers on labeled datasets offline")
+    Evaluate_parser.add_argument("--models", type=str, nargs="+", required=True, help="Paths to models.")
+    Evaluate_parser.add_argument("--datasets", type=str, nargs="+", required=True, help="Paths to labeled datasets.")
+    Evaluate_parser.add_argument("--output", type=str, required=False, help="Path to save report (.json or .csv).")
+    Evaluate_parser.add_argument("--workers", type=int, required=False, help="Number of worker processes.")
+    
+    # Benchmark
+    Benchmark_parser = subparsers.add_parser("benchmark", help="Benchmark grasp trials")
+    Benchmark_parser.add_argument("--gripper", type=str, required=True, help="Type of gripper.(2f,3f)")
+    Benchmark_parser.add_argument("--object", type=str, required=True, help="Type of object.(cube, cylinder)")
+    Benchmark_parser.add_argument("--num", type=int, required=True, help="Number of trials.")
+    
     
     args = parser.parse_args()
     
@@ -35,12 +50,17 @@ def main():
         env.get_data(num=args.num,csv_path=args.output)
     elif args.mode == "training":
         if args.test_size is None:
-            train_classifier_based_planner(dataset_path=args.dataset, model_output_path=args.model)
+            train_classifier_based_planner(dataset_path=args.dataset, model_output_path=args.model, regression=args.regression)
         else:
-            train_classifier_based_planner(dataset_path=args.dataset, model_output_path=args.model, test_size=args.test_size)
+            train_classifier_based_planner(dataset_path=args.dataset, model_output_path=args.model, test_size=args.test_size, regression=args.regression)
     elif args.mode == "testing":
         env = SimEnv(robot=args.gripper, object=args.object)
         env.test(num=args.num,model_path=args.model)
+    elif args.mode == "evaluate":
+        evaluate_planners(model_paths=args.models, dataset_paths=args.datasets, output_path=args.output, max_workers=args.workers)
+    elif args.mode == "benchmark":
+        env = SimEnv(robot=args.gripper, object=args.object)
+        env.benchmark(num=args.num)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file